@@ -27,14 +27,12 @@ else:
     logger = console_logger
     logger.info("Using console logger")
 
-def fills_callback(ws_message: dict):
-    message: FillsMsg = ws_message
-    data:FillsData = message['data']
+def fills_callback(ws_message: FillsMsg):
+    data: FillsData = ws_message.data
     print(data)
 
-def position_callback(ws_message: dict):
-    message: PositionMsg = ws_message
-    data:PositionData = message['data']
+def position_callback(ws_message: PositionMsg):
+    data: PositionData = ws_message.data
     print(data)
 
 def transfer_callback(ws_message: dict):
@@ -56,24 +54,22 @@ def main():
     params = {'market': 'ETH-USD-PERP'}
 
     print('Subscribe to FILLS')
-    sub_id_fills = paradex.ws_subscribe(channel=fills_channel, callback=position_callback, params=params)
-    time.sleep(5)
+    sub_id_fills = paradex.ws_subscribe(channel=fills_channel, callback=fills_callback, params=params).result(timeout=5)
 
     print('Subscribe to POSITIONS')
-    sub_id_position = paradex.ws_subscribe(channel=positions_channel, callback=position_callback)
-    time.sleep(5)
+    sub_id_position = paradex.ws_subscribe(channel=positions_channel, callback=position_callback).result(timeout=5)
 
     print('Subscribe to TRANSFERS')
-    sub_id_transfer = paradex.ws_subscribe(channel=transfer_channel, callback=transfer_callback)
+    sub_id_transfer = paradex.ws_subscribe(channel=transfer_channel, callback=transfer_callback).result(timeout=5)
+
+    # Receive messages for a while before unsubscribing
     time.sleep(5)
 
     print('Unsubscribe from TRANSFERS')
     paradex.ws_unsubscribe(channel=transfer_channel, subscription_id=sub_id_transfer)
-    time.sleep(5)
 
     print('Unsubscribe from FILLS')
     paradex.ws_unsubscribe(channel=fills_channel, subscription_id=sub_id_fills, params=params)
-    time.sleep(5)
 
     print('Unsubscribe from POSITIONS')
     paradex.ws_unsubscribe(channel=positions_channel, subscription_id=sub_id_position)
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from paradex_py.account.account import ParadexAccount
 from paradex_py.api.http_client import HttpClient, HttpMethod
-from paradex_py.api.models import AccountSummary, AccountSummarySchema, AuthSchema, SystemConfig, SystemConfigSchema
+from paradex_py.api.models import AccountSummary, Auth, SystemConfig
 from paradex_py.common.order import Order
 from paradex_py.environment import Environment
 from paradex_py.utils import raise_value_error
@@ -52,7 +52,7 @@ class ParadexApiClient(HttpClient):
     def auth(self):
         headers = self.account.auth_headers()
         res = self.post(api_url=self.api_url, path="auth", headers=headers)
-        data = AuthSchema().load(res, unknown="exclude", partial=True)
+        data = Auth.from_dict(res)
         self.auth_timestamp = time.time()
         self.account.set_jwt_token(data.jwt_token)
         self.client.headers.update({"Authorization": f"Bearer {data.jwt_token}"})
@@ -255,7 +255,7 @@ class ParadexApiClient(HttpClient):
         Private endpoint requires authorization.
         """
         res = self._get_authorized(path="account")
-        return AccountSummarySchema().load(res, unknown="exclude", partial=True)
+        return AccountSummary.from_dict(res)
 
     def fetch_account_profile(self) -> Dict:
         """Fetch profile for this account.
@@ -394,7 +394,7 @@ class ParadexApiClient(HttpClient):
             url=f"{self.api_url}/system/config",
             http_method=HttpMethod.GET,
         )
-        config = SystemConfigSchema().load(res, unknown="exclude", partial=True)
+        config = SystemConfig.from_dict(res)
         self.logger.info(f"{self.classname}: SystemConfig:{config}")
         return config
 
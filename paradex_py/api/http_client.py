@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from paradex_py.api.models import ApiErrorSchema
+from paradex_py.api.models import ApiError
 
 
 class HttpMethod(Enum):
@@ -33,7 +33,7 @@ class HttpClient:
             headers=headers,
         )
         if res.status_code >= 300:
-            error = ApiErrorSchema().loads(res.text)
+            error = ApiError.from_json(res.content)
             raise Exception(error)
         try:
             return res.json()
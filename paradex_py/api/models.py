@@ -1,21 +1,23 @@
 from dataclasses import dataclass
-from typing import Optional, TypedDict
 from enum import Enum
+from typing import Optional
 
 import marshmallow_dataclass
+import msgspec
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
-from paradex_py.common.order import OrderSide, OrderStatus, OrderType, OrderLiquidity
+from paradex_py.common.order import OrderLiquidity, OrderSide, OrderStatus
 
 
 @dataclass
-class ApiError:
+class ApiError(DataClassORJSONMixin):
     error: str
     message: str
-    data: Optional[dict]
+    data: Optional[dict] = None
 
 
 @dataclass
-class BridgedToken:
+class BridgedToken(DataClassORJSONMixin):
     name: str
     symbol: str
     decimals: int
@@ -26,7 +28,7 @@ class BridgedToken:
 
 
 @dataclass
-class SystemConfig:
+class SystemConfig(DataClassORJSONMixin):
     starknet_gateway_url: str
     starknet_fullnode_rpc_url: str
     starknet_chain_id: str
@@ -44,7 +46,7 @@ class SystemConfig:
 
 
 @dataclass
-class AccountSummary:
+class AccountSummary(DataClassORJSONMixin):
     account: str
     initial_margin_requirement: str
     maintenance_margin_requirement: str
@@ -59,10 +61,12 @@ class AccountSummary:
 
 
 @dataclass
-class Auth:
+class Auth(DataClassORJSONMixin):
     jwt_token: str
 
 
+# Deprecated: marshmallow schemas are kept for backwards compatibility,
+# use `from_dict`/`from_json` provided by `DataClassORJSONMixin` instead.
 ApiErrorSchema = marshmallow_dataclass.class_schema(ApiError)
 SystemConfigSchema = marshmallow_dataclass.class_schema(SystemConfig)
 AuthSchema = marshmallow_dataclass.class_schema(Auth)
@@ -109,12 +113,79 @@ class ParadexWebsocketChannel(Enum):
     TRANSFERS = "transfers"
 
 
+# Websocket payloads are decoded straight into msgspec structs,
+# numeric fields are kept as strings as sent by Paradex
+class BBOData(msgspec.Struct, gc=False):
+    market: str
+    seq_no: int
+    ask: str
+    ask_size: str
+    bid: str
+    bid_size: str
+    last_updated_at: int
+
+
+class BBOMsg(msgspec.Struct, gc=False):
+    channel: str
+    data: BBOData
+
+
+class PositionSide(Enum):
+    LONG = "LONG"
+    SHORT = "SHORT"
+
+
+# Fields Paradex may leave out default to None
+class PositionData(msgspec.Struct, gc=False, kw_only=True):
+    id: str
+    market: str
+    status: OrderStatus
+    side: PositionSide
+    size: str
+    average_entry_price: str
+    average_entry_price_usd: Optional[str] = None
+    average_exit_price: Optional[str] = None
+    unrealized_pnl: Optional[str] = None
+    unrealized_funding_pnl: Optional[str] = None
+    cost: str
+    cost_usd: Optional[str] = None
+    cached_funding_index: Optional[str] = None
+    last_updated_at: int
+    created_at: int
+    last_fill_id: Optional[str] = None
+    seq_no: int
+    liquidation_price: Optional[str] = None
+    leverage: Optional[str] = None
+    realized_positional_pnl: Optional[str] = None
+    realized_positional_funding_pnl: Optional[str] = None
+
+
+class PositionMsg(msgspec.Struct, gc=False):
+    channel: str
+    data: PositionData
+
+
+class FillsData(msgspec.Struct, gc=False, kw_only=True):
+    id: str
+    side: OrderSide
+    liquidity: OrderLiquidity
+    market: str
+    order_id: str
+    price: str
+    size: str
+    fee: str
+    fee_currency: str
+    created_at: int
+    remaining_size: Optional[str] = None
+    client_id: Optional[str] = None
+    fill_type: Optional[str] = None
+    realized_pnl: Optional[str] = None
+    realized_funding: Optional[str] = None
+
+
+class FillsMsg(msgspec.Struct, gc=False):
+    channel: str
+    data: FillsData
 
-BBOData = TypedDict("BBOData", {'market': str, 'seq_no': int, 'ask': str, 'ask_size': str, 'bid': str, 'bid_size': str, 'last_updated_at': int})
-BBOMsg = TypedDict("BBOMsg", {"channel": str, "data": BBOData})
-PositionData = TypedDict("PositionData", {'id': str, 'market': str, 'status': OrderStatus, 'side': OrderSide, 'size': str, 'average_entry_price': str, 'average_entry_price_usd': str, 'average_exit_price': str, 'unrealized_pnl': str, 'unrealized_funding_pnl': str, 'cost': str, 'cost_usd': str, 'cached_funding_index': str, 'last_updated_at': int, 'created_at': int, 'last_fill_id': str, 'seq_no': int, 'liquidation_price': str, 'leverage': str, 'realized_positional_pnl': str, 'realized_positional_funding_pnl': str})
-PositionMsg = TypedDict("PositionMsg", {"channel": str, "data": PositionData})
-FillsData = TypedDict("FillsData", {'id': str, 'side': OrderSide, 'liquidity': OrderLiquidity, 'market': str, 'order_id': str, 'price': str, 'size': str, 'fee': str, 'fee_currency': str, 'created_at': int, 'remaining_size': str, 'client_id': str, 'fill_type': str, 'realized_pnl': str, 'realized_funding': str})
-FillsMsg = TypedDict("FillsMsg", {"channel": str, "data": FillsData})
 
-# todo add other msg typing if necessary
\ No newline at end of file
+# todo add other msg typing if necessary
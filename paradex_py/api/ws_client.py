@@ -1,24 +1,182 @@
-import json
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import itertools
 import logging
+import queue
+import socket
 import threading
 import time
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import types
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-import websocket
+import msgspec
+import orjson
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, WebSocketException
 
 from paradex_py.account.account import ParadexAccount
-from paradex_py.api.models import ParadexWebsocketChannel
+from paradex_py.api.models import BBOMsg, FillsMsg, ParadexWebsocketChannel, PositionMsg
 from paradex_py.environment import Environment
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None  # type: ignore[assignment]
+
+# Raw markers used to drop keepalive and non-actionable frames before parsing
+_PONG_MARKER = b'"channel":"pong"'
+_PARAMS_MARKER = b'"params"'
+_CONNECTION_ESTABLISHED = b"Websocket connection established."
+_CHANNEL_MARKER = b'"channel":"'
+
+_NO_SUBSCRIPTIONS: types.MappingProxyType = types.MappingProxyType({})
+
+_PING_INTERVAL_SECONDS = 50
+_PING_TIMEOUT_SECONDS = 10
+_RECONNECT_DELAY_SECONDS = 5
+# Incoming frames buffered by websockets before reading is paused
+_MAX_QUEUE = 1024
+
+# Outbound frames queued within this window are flushed to the socket together
+_WRITE_COALESCE_SECONDS = 0.002
+_WRITE_MAX_FRAMES = 64
+
+# Sync callbacks run on worker threads, a subscription always maps to the same worker to keep message order
+_CALLBACK_WORKERS = 4
+_CALLBACK_QUEUE_SIZE = 10_000
+
+
+def _request_template(method: str, channel_with_params: str) -> str:
+    return '{"id":%d,"jsonrpc":"2.0","method":"' + method + '","params":{"channel":"' + channel_with_params + '"}}'
+
+
+# Channels without params always produce the same request apart from the id
+_SUBSCRIBE_TEMPLATES: Dict[str, str] = {
+    c.value: _request_template("subscribe", c.value) for c in ParadexWebsocketChannel if "{" not in c.value
+}
+_UNSUBSCRIBE_TEMPLATES: Dict[str, str] = {
+    c.value: _request_template("unsubscribe", c.value) for c in ParadexWebsocketChannel if "{" not in c.value
+}
+
+
+# Channels Paradex allows to subscribe to only once per connection
+_SINGLE_SUBSCRIPTION_CHANNELS = frozenset(
+    (
+        "account",
+        "balance_events",
+        "markets_summary",
+        "positions",
+        "tradebusts",
+        "transaction",
+        "transfers",
+    )
+)
+
+_T = TypeVar("_T")
+
+
+class _Notification(msgspec.Struct, Generic[_T], gc=False):
+    params: _T
+
+
+# Channels delivered to callbacks as typed structs, keyed by channel name prefix
+_TYPED_DECODERS: Dict[bytes, msgspec.json.Decoder] = {
+    b"bbo": msgspec.json.Decoder(_Notification[BBOMsg]),
+    b"fills": msgspec.json.Decoder(_Notification[FillsMsg]),
+    b"positions": msgspec.json.Decoder(_Notification[PositionMsg]),
+}
+
+
+def _typed_decoder(message: bytes) -> Optional[msgspec.json.Decoder]:
+    # Peek at the channel name in the raw frame to pick a decoder without parsing it
+    start = message.find(_CHANNEL_MARKER)
+    if start == -1:
+        return None
+    start += len(_CHANNEL_MARKER)
+    channel_with_params = message[start : message.find(b'"', start)]
+    return _TYPED_DECODERS.get(channel_with_params.partition(b".")[0])
+
+
+@functools.lru_cache(maxsize=512)
+def _format_channel_cached(channel: ParadexWebsocketChannel, params: Tuple[Tuple[str, Any], ...]) -> str:
+    return channel.value.format_map(dict(params))
+
+
+def _format_channel(channel: ParadexWebsocketChannel, params: dict) -> str:
+    # e.g. `fills.{market}` -> `fills.ETH-USD-PERP`, cached per (channel, params) pair
+    return _format_channel_cached(channel, tuple(sorted(params.items())))
+
+
+@contextlib.contextmanager
+def _corked(sock: Optional[Any]) -> Iterator[None]:
+    # TCP_CORK holds partial packets until uncorked, so several small
+    # frames written in a row leave in as few segments as possible (Linux only)
+    if sock is None or not hasattr(socket, "TCP_CORK"):
+        yield
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+    try:
+        yield
+    finally:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+
+
+class SubscriptionFuture(concurrent.futures.Future):
+    """Future resolved with the subscription id once Paradex acknowledges the subscription.
+    The id is available right away as `subscription_id`, `unsubscribe` accepts either.
+    """
+
+    def __init__(self, subscription_id: int):
+        super().__init__()
+        self.subscription_id = subscription_id
+
+
+# Coroutine function callbacks are scheduled on the event loop, others run on the callback workers
+SubscriptionCallback = Union[Callable[[Any], None], Callable[[Any], Awaitable[None]]]
+
 
 class ActiveSubscription(NamedTuple):
-    callback: Callable[[Any], None]
+    callback: SubscriptionCallback
     subscription_id: int
+    is_coroutine: bool = False
 
 
-class ParadexWebsocketClient(threading.Thread):
-    classname: str = "ParadexWebsocketClient"
+class AsyncParadexWebsocketClient:
+    """Class to interact with Paradex Websocket API from an asyncio event loop.
+        Sync callbacks run on a pool of worker threads, coroutine callbacks are scheduled as tasks.
+        BBO, fills and positions messages are passed to callbacks as `BBOMsg`, `FillsMsg` and `PositionMsg`,
+        other channels as dicts. Messages that don't match their struct schema are passed as dicts too.
+
+    Args:
+        env (Environment): Environment
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        account (ParadexAccount, optional): Account used to authenticate. Defaults to None.
+        on_reconnect (Callable, optional): Called with the client after each reconnect. Defaults to None.
+
+    Examples:
+        >>> client = AsyncParadexWebsocketClient(env=TESTNET)
+        >>> client.subscribe(ParadexWebsocketChannel.BBO, print, params={"market": "ETH-USD-PERP"})
+        >>> await client.run()
+    """
+
+    classname: str = "AsyncParadexWebsocketClient"
 
     def __init__(
         self,
@@ -27,186 +185,676 @@ class ParadexWebsocketClient(threading.Thread):
         account: ParadexAccount = None,
         on_reconnect: Optional[Callable] = None,
     ):
-        super().__init__()
         self.env = env
         self.api_url = f"wss://ws.api.{self.env}.paradex.trade/v1"
         self.logger = logger or logging.getLogger(__name__)
         self.ws_ready = False
         self.account: Optional[ParadexAccount] = account
-        self.queued_subscriptions: List[Tuple[ParadexWebsocketChannel, Dict, ActiveSubscription]] = []
-        self.active_subscriptions: Dict[str, List[ActiveSubscription]] = defaultdict(list)
+        self.queued_subscriptions: List[
+            Tuple[ParadexWebsocketChannel, Dict, ActiveSubscription, SubscriptionFuture]
+        ] = []
+        self.active_subscriptions: Dict[str, List[ActiveSubscription]] = {}
+        # Read-only snapshot of active_subscriptions used on the message hot path,
+        # keyed by channel name prefix and then by the rest of the channel, e.g. "fills" -> "ETH-USD-PERP"
+        self._dispatch: Dict[str, Dict[str, Tuple[ActiveSubscription, ...]]] = {}
         self.subscription_id_counter = 0
+        # JSON-RPC ids only need to be unique, count up from the start time
+        self._rpc_id = itertools.count(int(time.time() * 1_000_000))
+        # Subscribe request id -> (channel, subscription id, future resolved once Paradex acknowledges it) entries
+        self._pending_acks: Dict[int, List[Tuple[str, int, concurrent.futures.Future]]] = {}
+        # Channel -> (subscription id, future) entries left unacknowledged by a lost connection, acked on replay
+        self._replay_acks: Dict[str, List[Tuple[int, concurrent.futures.Future]]] = {}
 
         self.on_reconnect = on_reconnect  # Store the callback function
 
-        self.bearer_header = None
+        self.ws: Optional[ClientConnection] = None
+        self._closed = False
+        self._out_q: Optional[asyncio.Queue[str]] = None
+        # Keeps references to tasks created for coroutine callbacks
+        self._callback_tasks: Set[asyncio.Task] = set()
+        # None tells a worker to stop
+        self._callback_queues: List[queue.Queue[Optional[Tuple[Callable[[Any], None], Any]]]] = [
+            queue.Queue(maxsize=_CALLBACK_QUEUE_SIZE) for _ in range(_CALLBACK_WORKERS)
+        ]
+        # Messages for a worker whose queue is full, handed over before reading the next frame
+        self._held_callbacks: List[Tuple[queue.Queue, Tuple[Callable[[Any], None], Any]]] = []
+        # Started by run() and stopped once it returns
+        self._callback_workers: List[threading.Thread] = []
+
+    def _bearer_header(self) -> Optional[Dict[str, str]]:
         if self.account:
-            self.bearer_header = {"Authorization": f"Bearer {self.account.jwt_token}"}
+            return {"Authorization": f"Bearer {self.account.jwt_token}"}
+        return None
 
-        self.ws = websocket.WebSocketApp(
-            self.api_url, on_message=self.read_messages, on_open=self.on_open, header=self.bearer_header
-        )
-        self.ping_sender = threading.Thread(target=self.send_ping)
+    async def run(self) -> None:
+        """Connects to Paradex and reads messages until `close` is called.
+        Reconnects when the connection is lost.
+        """
+        self._out_q = asyncio.Queue()
+        writer = asyncio.create_task(self._writer_loop())
+        self._callback_workers = [
+            threading.Thread(target=self._callback_worker, args=(callback_queue,), daemon=True)
+            for callback_queue in self._callback_queues
+        ]
+        for worker in self._callback_workers:
+            worker.start()
+        try:
+            while not self._closed:
+                try:
+                    await self._connect_and_read()
+                except (OSError, WebSocketException) as e:
+                    self.logger.warning("%s: Websocket error: %s", self.classname, e)
+                except Exception:
+                    # Never let an unexpected error stop the client, reconnect instead
+                    self.logger.exception("%s: Unexpected websocket error", self.classname)
+                if self._closed:
+                    break
+                self.logger.warning("%s: Websocket is not connected. Attempting to reconnect...", self.classname)
+                await self.reconnect()
+        finally:
+            writer.cancel()
+            self._fail_replay_acks()
+            # Workers may still be busy with queued messages, wait for them off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._stop_callback_workers)
 
-    def run(self):
-        self.ping_sender.start()
-        self.ws.run_forever()
+    async def _connect_and_read(self) -> None:
+        # Keepalive uses websocket protocol ping frames, permessage-deflate
+        # is disabled as small market data frames don't benefit from it
+        async with connect(
+            self.api_url,
+            additional_headers=self._bearer_header(),
+            compression=None,
+            max_queue=_MAX_QUEUE,
+            ping_interval=_PING_INTERVAL_SECONDS,
+            ping_timeout=_PING_TIMEOUT_SECONDS,
+        ) as ws:
+            self.ws = ws
+            if self._closed:
+                # close() was called during the handshake, before this connection could be closed by it
+                await ws.close()
+                return
+            self.on_open()
+            try:
+                while True:
+                    # Text frames are read as bytes to skip UTF-8 decoding, orjson validates while parsing
+                    message = cast(bytes, await ws.recv(decode=False))
+                    try:
+                        self.read_messages(message)
+                    except Exception:
+                        self.logger.exception("%s: Error handling websocket message %s", self.classname, message)
+                    if self._held_callbacks:
+                        await self._wait_for_callback_workers()
+            except ConnectionClosedOK:
+                pass
+            finally:
+                self.ws_ready = False
+                self._defer_pending_acks()
+
+    async def close(self) -> None:
+        """Closes the websocket connection and stops reconnecting."""
+        self._closed = True
+        self.ws_ready = False
+        if self.ws is not None:
+            await self.ws.close()
 
-    def send_ping(self):
+    async def reconnect(self) -> None:
+        self.ws_ready = False  # Mark as not ready
+        await asyncio.sleep(_RECONNECT_DELAY_SECONDS)  # Wait before retrying
+        self.logger.warning("Reconnecting websocket...")
+        # Active subscriptions are replayed in on_open once connected
+        if self.on_reconnect:
+            self.on_reconnect(self)
+
+    def _callback_worker(self, callback_queue: "queue.Queue[Optional[Tuple[Callable[[Any], None], Any]]]") -> None:
         while True:
-            time.sleep(50)
-            if self.ws and self.ws.sock and self.ws.sock.connected:
-                logging.debug("Websocket sending ping")
-                try:
-                    self.ws.send(json.dumps({"method": "ping"}))
-                except websocket.WebSocketConnectionClosedException:
-                    logging.warning("Websocket connection closed. Attempting to reconnect...")
-                    self.reconnect()
-            else:
-                logging.warning("Websocket is not connected. Attempting to reconnect...")
-                self.reconnect()
+            item = callback_queue.get()
+            if item is None:
+                return
+            callback, data = item
+            try:
+                callback(data)
+            except Exception:
+                self.logger.exception("%s: Error in subscription callback %s", self.classname, callback)
+
+    def _stop_callback_workers(self) -> None:
+        for callback_queue in self._callback_queues:
+            callback_queue.put(None)
+        for worker in self._callback_workers:
+            worker.join()
+        self._callback_workers = []
+
+    def _send(self, payload: Any) -> None:
+        self._send_frame(orjson.dumps(payload).decode())
+
+    def _outbound_queue(self) -> "asyncio.Queue[str]":
+        # Created by run() so that it belongs to the loop the client runs on
+        if self._out_q is None:
+            raise RuntimeError(f"{self.classname}: Client is not running")
+        return self._out_q
+
+    def _send_frame(self, frame: str) -> None:
+        self._outbound_queue().put_nowait(frame)
 
-    def on_open(self, _ws):
-        logging.debug("on_open")
+    async def _writer_loop(self) -> None:
+        out_q = self._outbound_queue()
+        while True:
+            frames = [await out_q.get()]
+            await asyncio.sleep(_WRITE_COALESCE_SECONDS)
+            while len(frames) < _WRITE_MAX_FRAMES and not out_q.empty():
+                frames.append(out_q.get_nowait())
+            try:
+                await self._write_frames(frames)
+            except Exception:
+                # The writer must keep running, or every later frame would sit in the queue forever
+                self.logger.exception("%s: Failed to write %d frame(s)", self.classname, len(frames))
+
+    async def _write_frames(self, frames: List[str]) -> None:
+        ws = self.ws
+        if ws is None:
+            self.logger.warning("%s: Websocket not connected, dropped %d frame(s)", self.classname, len(frames))
+            return
+        raw_sock = ws.transport.get_extra_info("socket") if len(frames) > 1 else None
+        try:
+            with _corked(raw_sock):
+                for frame in frames:
+                    await ws.send(frame)
+        except (ConnectionClosed, OSError):
+            self.logger.warning("%s: Websocket connection closed, dropped %d frame(s)", self.classname, len(frames))
+
+    def on_open(self):
+        self.logger.debug("%s: on_open", self.classname)
         self.ws_ready = True
         if self.account:
             self.send_auth_id()
-        for channel, params, active_subscription in self.queued_subscriptions:
-            self.subscribe(
-                channel=channel,
-                callback=active_subscription.callback,
-                subscription_id=active_subscription.subscription_id,
-                params=params,
+        self._replay_subscriptions()
+        queued_subscriptions, self.queued_subscriptions = self.queued_subscriptions, []
+        try:
+            self._subscribe_batch(
+                [
+                    (channel, active_subscription.callback, active_subscription.subscription_id, params, future)
+                    for channel, params, active_subscription, future in queued_subscriptions
+                ]
             )
+        except Exception as e:
+            # Fail the queued subscriptions rather than the connection
+            self.logger.exception("%s: Failed to send queued subscriptions", self.classname)
+            for *_, future in queued_subscriptions:
+                self._set_ack_exception(future, e)
+
+    def _replay_subscriptions(self) -> None:
+        # Replay subscriptions that were active before a reconnect
+        replay_acks, self._replay_acks = self._replay_acks, {}
+        requests = []
+        for channel_with_params in self.active_subscriptions:
+            rpc_id = next(self._rpc_id)
+            if channel_with_params in replay_acks:
+                self._pending_acks[rpc_id] = [
+                    (channel_with_params, subscription_id, future)
+                    for subscription_id, future in replay_acks.pop(channel_with_params)
+                ]
+            requests.append(self._subscribe_request(channel_with_params, rpc_id))
+        self._send_requests(requests)
+        # Subscriptions removed while disconnected are not replayed
+        for entries in replay_acks.values():
+            for _, future in entries:
+                self._set_ack_exception(future, ConnectionError(f"{self.classname}: Subscription was removed"))
 
     def send_auth_id(self) -> None:
         """
         Sends an authentication message to the Paradex WebSocket.
         """
-        self.ws.send(
-            json.dumps(
-                {
-                    "id": int(time.time() * 1_000_000),
-                    "jsonrpc": "2.0",
-                    "method": "auth",
-                    "params": {"bearer": self.account.jwt_token},
-                }
-            )
+        self._send(
+            {
+                "id": next(self._rpc_id),
+                "jsonrpc": "2.0",
+                "method": "auth",
+                "params": {"bearer": self.account.jwt_token},
+            }
         )
-        self.logger.info(f"{self.classname}: Authenticated to {self.api_url}")
+        self.logger.info("%s: Authenticated to %s", self.classname, self.api_url)
+
+    def read_messages(self, message: bytes):
+        if message == _CONNECTION_ESTABLISHED:
+            self.logger.debug("%s: %s", self.classname, message)
+            return
+
+        # Arguments are formatted lazily, only when debug logging is enabled
+        self.logger.debug("on_message %s", message)
+        if _PONG_MARKER in message:
+            self.logger.debug("Websocket received pong")
+            return
+        if _PARAMS_MARKER not in message:
+            if self._pending_acks:
+                self._resolve_acks(message)
+            else:
+                self.logger.debug("%s: Non-actionable message:%s", self.classname, message)
+            return
 
-    def read_messages(self, _ws, message):
-        if message == "Websocket connection established.":
-            logging.debug(message)
+        if self._read_typed_message(message):
             return
 
-        logging.debug(f"on_message {message}")
-        ws_msg = json.loads(message)
+        ws_msg = orjson.loads(message)
 
         if "params" not in ws_msg:
-            self.logger.debug(f"{self.classname}: Non-actionable message:{ws_msg}")
+            self.logger.debug("%s: Non-actionable message:%s", self.classname, ws_msg)
         else:
             data = ws_msg["params"]
             channel_with_params = data.get("channel")
 
             if channel_with_params == "pong":
-                logging.debug("Websocket received pong")
+                self.logger.debug("Websocket received pong")
                 return
             if channel_with_params is None:
-                logging.debug(f"Could not handle message with data - {data}")
+                self.logger.debug("Could not handle message with data - %s", data)
                 return
 
-            active_subscriptions = self.active_subscriptions[channel_with_params]
-            if len(active_subscriptions) == 0:
-                logging.info("Websocket message from an unexpected subscription:", message, channel_with_params)
-                logging.info("Probably it was already closed")
-            else:
-                for active_subscription in active_subscriptions:
-                    active_subscription.callback(data)
+            self._dispatch_message(channel_with_params, data)
+
+    def _resolve_acks(self, message: bytes) -> None:
+        ws_msg = orjson.loads(message)
+        # Responses to a batch request arrive as a JSON array
+        for response in ws_msg if isinstance(ws_msg, list) else (ws_msg,):
+            for channel_with_params, subscription_id, future in self._pending_acks.pop(response.get("id"), ()):
+                if "error" in response:
+                    # Rejected subscriptions must not be replayed on reconnect
+                    self._remove_subscription(channel_with_params, subscription_id)
+                    self._set_ack_exception(
+                        future, RuntimeError(f"{self.classname}: Subscribe failed: {response['error']}")
+                    )
+                elif not future.done():
+                    future.set_result(subscription_id)
+
+    @staticmethod
+    def _set_ack_exception(future: concurrent.futures.Future, exception: BaseException) -> None:
+        # The caller may have cancelled the future already
+        if not future.done():
+            future.set_exception(exception)
+
+    def _defer_pending_acks(self) -> None:
+        # Requests sent on a lost connection are never acknowledged, subscriptions
+        # are replayed on reconnect and their futures resolved by the replayed request instead
+        pending_acks, self._pending_acks = self._pending_acks, {}
+        for entries in pending_acks.values():
+            for channel_with_params, subscription_id, future in entries:
+                if not future.done():
+                    self._replay_acks.setdefault(channel_with_params, []).append((subscription_id, future))
+
+    def _fail_replay_acks(self) -> None:
+        replay_acks, self._replay_acks = self._replay_acks, {}
+        for entries in replay_acks.values():
+            for _, future in entries:
+                self._set_ack_exception(
+                    future, ConnectionError(f"{self.classname}: Websocket closed before subscribe was acknowledged")
+                )
+
+    def _read_typed_message(self, message: bytes) -> bool:
+        decoder = _typed_decoder(message)
+        if decoder is None:
+            return False
+        try:
+            msg = decoder.decode(message).params
+        except msgspec.ValidationError as e:
+            # Account events must not be lost when Paradex adds a field value the structs don't know yet
+            self.logger.warning("%s: Message does not match its schema, passing it as dict: %s", self.classname, e)
+            return False
+        self._dispatch_message(msg.channel, msg)
+        return True
+
+    def _dispatch_message(self, channel_with_params: str, data: Any) -> None:
+        prefix, _, params = channel_with_params.partition(".")
+        active_subscriptions = self._dispatch.get(prefix, _NO_SUBSCRIPTIONS).get(params)
+        if active_subscriptions is None:
+            self.logger.info(
+                "%s: Websocket message from an unexpected subscription:%s, probably it was already closed",
+                self.classname,
+                channel_with_params,
+            )
+        else:
+            for active_subscription in active_subscriptions:
+                if active_subscription.is_coroutine:
+                    task = asyncio.ensure_future(cast(Awaitable[None], active_subscription.callback(data)))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_tasks.discard)
+                else:
+                    self._queue_callback(active_subscription, data)
+
+    def _queue_callback(self, active_subscription: ActiveSubscription, data: Any) -> None:
+        # Must never block the event loop, messages for a full queue are held back until the reader waits for it
+        callback_queue = self._callback_queues[active_subscription.subscription_id % _CALLBACK_WORKERS]
+        item = (cast(Callable[[Any], None], active_subscription.callback), data)
+        if self._held_callbacks:
+            # Keep message order behind messages already held back
+            self._held_callbacks.append((callback_queue, item))
+            return
+        try:
+            callback_queue.put_nowait(item)
+        except queue.Full:
+            self._held_callbacks.append((callback_queue, item))
+
+    async def _wait_for_callback_workers(self) -> None:
+        # Reading stops until the workers catch up, unread frames back up in websockets and then in TCP,
+        # while the event loop keeps answering pings
+        self.logger.warning("%s: Callback workers are falling behind, pausing reads", self.classname)
+        loop = asyncio.get_running_loop()
+        held_callbacks, self._held_callbacks = self._held_callbacks, []
+        for callback_queue, item in held_callbacks:
+            await loop.run_in_executor(None, callback_queue.put, item)
 
     def subscribe(
         self,
         channel: ParadexWebsocketChannel,
-        callback: Callable[[Any], None],
+        callback: SubscriptionCallback,
         subscription_id: Optional[int] = None,
         params: Optional[dict] = None,
-    ) -> int:
-        if subscription_id is None:
-            self.subscription_id_counter += 1
-            subscription_id = self.subscription_id_counter
+    ) -> SubscriptionFuture:
+        """Subscribe to a channel.
+        Subscriptions made before the websocket is connected are sent once it is.
 
-        if params is None:
-            params = {}
-        channel_with_params = channel.value.format(**params)
+        Returns:
+            SubscriptionFuture resolved with the subscription id once Paradex acknowledges the subscription
+        """
+        return self._subscribe_batch([(channel, callback, subscription_id, params, None)])[0]
+
+    def subscribe_many(
+        self, specs: List[Tuple[ParadexWebsocketChannel, SubscriptionCallback, Optional[dict]]]
+    ) -> List[SubscriptionFuture]:
+        """Subscribe to several channels at once.
+        Subscribe requests are sent to Paradex as a single JSON-RPC batch frame,
+        subscriptions made before the websocket is connected are sent one by one once it is.
+
+        Args:
+            specs: List of (channel, callback, params) tuples
+
+        Returns:
+            List of SubscriptionFuture resolved with subscription ids, in the same order as specs
+        """
+        return self._subscribe_batch(
+            [(channel, callback, None, params, None) for channel, callback, params in specs], batch_frame=True
+        )
+
+    def _subscribe_batch(
+        self,
+        specs: List[
+            Tuple[
+                ParadexWebsocketChannel,
+                SubscriptionCallback,
+                Optional[int],
+                Optional[dict],
+                Optional[SubscriptionFuture],
+            ]
+        ],
+        batch_frame: bool = False,
+    ) -> List[SubscriptionFuture]:
+        resolved: List[Tuple[ParadexWebsocketChannel, Dict, str, ActiveSubscription, SubscriptionFuture]] = []
+        for channel, callback, subscription_id, params, future in specs:
+            if subscription_id is None:
+                self.subscription_id_counter += 1
+                subscription_id = self.subscription_id_counter
+            if params is None:
+                params = {}
+            channel_with_params = _format_channel(channel, params)
+            active_subscription = ActiveSubscription(callback, subscription_id, asyncio.iscoroutinefunction(callback))
+            resolved.append(
+                (
+                    channel,
+                    params,
+                    channel_with_params,
+                    active_subscription,
+                    future or SubscriptionFuture(subscription_id),
+                )
+            )
+
+        self._validate_subscriptions([channel_with_params for _, _, channel_with_params, _, _ in resolved])
 
         if not self.ws_ready:
-            logging.debug("enqueueing subscription")
-            self.queued_subscriptions.append((channel, params, ActiveSubscription(callback, subscription_id)))
+            self.logger.debug("%s: enqueueing subscription", self.classname)
+            for channel, params, _, active_subscription, future in resolved:
+                self.queued_subscriptions.append((channel, params, active_subscription, future))
+            return [future for *_, future in resolved]
+
+        self.logger.debug("%s: subscribing", self.classname)
+
+        requests = []
+        for _, params, channel_with_params, active_subscription, future in resolved:
+            self.active_subscriptions.setdefault(channel_with_params, []).append(active_subscription)
+            self._update_dispatch(channel_with_params)
+            self.logger.info(
+                "%s: Subscribe channel:%s params:%s callback:%s",
+                self.classname,
+                channel_with_params,
+                params,
+                active_subscription.callback,
+            )
+            rpc_id = next(self._rpc_id)
+            self._pending_acks[rpc_id] = [(channel_with_params, active_subscription.subscription_id, future)]
+            requests.append(self._subscribe_request(channel_with_params, rpc_id))
+        self._send_requests(requests, batch_frame)
+        return [future for *_, future in resolved]
+
+    def _channel_request(self, method: str, templates: Dict[str, str], channel_with_params: str, rpc_id: int) -> str:
+        template = templates.get(channel_with_params)
+        if template is not None:
+            return template % rpc_id
+        return orjson.dumps(
+            {
+                "id": rpc_id,
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": {"channel": channel_with_params},
+            }
+        ).decode()
+
+    def _subscribe_request(self, channel_with_params: str, rpc_id: int) -> str:
+        return self._channel_request("subscribe", _SUBSCRIBE_TEMPLATES, channel_with_params, rpc_id)
+
+    def _unsubscribe_request(self, channel_with_params: str, rpc_id: int) -> str:
+        return self._channel_request("unsubscribe", _UNSUBSCRIBE_TEMPLATES, channel_with_params, rpc_id)
+
+    def _send_requests(self, requests: List[str], batch_frame: bool = False) -> None:
+        # Only subscribe_many uses a JSON-RPC batch frame, the writer coalesces individual frames anyway
+        if batch_frame and len(requests) > 1:
+            self._send_frame("[" + ",".join(requests) + "]")
         else:
-            logging.debug("subscribing")
-            if (
-                channel_with_params
-                in [
-                    "account",
-                    "balance_events",
-                    "markets_summary",
-                    "positions",
-                    "tradebusts",
-                    "transaction",
-                    "transfers",
-                ]
-                and len(self.active_subscriptions[channel_with_params]) != 0
+            for request in requests:
+                self._send_frame(request)
+
+    def _validate_subscriptions(self, channels_with_params: List[str]) -> None:
+        # Subscriptions waiting for the connection count as taken too
+        subscribing = {_format_channel(channel, params) for channel, params, _, _ in self.queued_subscriptions}
+        for channel_with_params in channels_with_params:
+            if channel_with_params in _SINGLE_SUBSCRIPTION_CHANNELS and (
+                self.active_subscriptions.get(channel_with_params) or channel_with_params in subscribing
             ):
                 raise NotImplementedError(f"Cannot subscribe to {channel_with_params} multiple times")
-            self.active_subscriptions[channel_with_params].append(ActiveSubscription(callback, subscription_id))
-            self.logger.info(
-                f"{self.classname}: Subscribe channel:{channel_with_params} params:{params} callback:{callback}"
-            )
-            self.ws.send(
-                json.dumps(
-                    {
-                        "id": int(time.time() * 1_000_000),
-                        "jsonrpc": "2.0",
-                        "method": "subscribe",
-                        "params": {"channel": channel_with_params},
-                    }
-                )
-            )
-        return subscription_id
+            subscribing.add(channel_with_params)
 
     def unsubscribe(
-        self, channel: ParadexWebsocketChannel, subscription_id: int, params: Optional[dict] = None
+        self,
+        channel: ParadexWebsocketChannel,
+        subscription_id: Union[int, SubscriptionFuture],
+        params: Optional[dict] = None,
     ) -> bool:
+        if isinstance(subscription_id, SubscriptionFuture):
+            subscription_id = subscription_id.subscription_id
         if not self.ws_ready:
             raise NotImplementedError("Can't unsubscribe before websocket connected")
         if params is None:
             params = {}
-        channel_with_params = channel.value.format(**params)
-        active_subscriptions = self.active_subscriptions[channel_with_params]
+        channel_with_params = _format_channel(channel, params)
+        removed = self._remove_subscription(channel_with_params, subscription_id)
+        if channel_with_params not in self.active_subscriptions:
+            self._send_frame(self._unsubscribe_request(channel_with_params, next(self._rpc_id)))
+        return removed
 
+    def _remove_subscription(self, channel_with_params: str, subscription_id: int) -> bool:
+        active_subscriptions = self.active_subscriptions.get(channel_with_params, [])
         new_active_subscriptions = [x for x in active_subscriptions if x.subscription_id != subscription_id]
         if len(new_active_subscriptions) == 0:
-            self.ws.send(
-                json.dumps(
-                    {
-                        "id": int(time.time() * 1_000_000),
-                        "jsonrpc": "2.0",
-                        "method": "unsubscribe",
-                        "params": {"channel": channel_with_params},
-                    }
-                )
-            )
-        self.active_subscriptions[channel_with_params] = new_active_subscriptions
+            self.active_subscriptions.pop(channel_with_params, None)
+        else:
+            self.active_subscriptions[channel_with_params] = new_active_subscriptions
+        self._update_dispatch(channel_with_params)
         return len(active_subscriptions) != len(new_active_subscriptions)
 
-    def reconnect(self):
-        self.ws_ready = False  # Mark as not ready
-        time.sleep(5)  # Wait before retrying
-        self.logger.warning("Reconnecting websocket...")
+    def _update_dispatch(self, channel_with_params: str) -> None:
+        prefix, _, params = channel_with_params.partition(".")
+        active_subscriptions = self.active_subscriptions.get(channel_with_params)
+        if active_subscriptions:
+            self._dispatch.setdefault(prefix, {})[params] = tuple(active_subscriptions)
+        elif prefix in self._dispatch:
+            self._dispatch[prefix].pop(params, None)
+            if not self._dispatch[prefix]:
+                del self._dispatch[prefix]
+
+
+class ParadexWebsocketClient(threading.Thread):
+    """Thread running `AsyncParadexWebsocketClient` on a private event loop.
+        Kept for backwards compatibility, methods can be called from any thread.
 
-        new_client = ParadexWebsocketClient(
-            env=self.env, logger=self.logger, account=self.account, on_reconnect=self.on_reconnect
+    Args:
+        env (Environment): Environment
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        account (ParadexAccount, optional): Account used to authenticate. Defaults to None.
+        on_reconnect (Callable, optional): Called with the client after each reconnect. Defaults to None.
+    """
+
+    classname: str = "ParadexWebsocketClient"
+
+    def __init__(
+        self,
+        env: Environment,
+        logger: Optional[logging.Logger] = None,
+        account: ParadexAccount = None,
+        on_reconnect: Optional[Callable] = None,
+    ):
+        super().__init__()
+        self.on_reconnect = on_reconnect
+        self.client = AsyncParadexWebsocketClient(
+            env=env, logger=logger, account=account, on_reconnect=self._handle_reconnect
         )
-        new_client.start()  # Start the new instance
+        # Only the private loop uses uvloop, the event loop policy of the host process is left alone
+        self.loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+
+    @property
+    def ws_ready(self) -> bool:
+        return self.client.ws_ready
+
+    @property
+    def active_subscriptions(self) -> Dict[str, List[ActiveSubscription]]:
+        return self.client.active_subscriptions
+
+    @property
+    def queued_subscriptions(
+        self,
+    ) -> List[Tuple[ParadexWebsocketChannel, Dict, ActiveSubscription, SubscriptionFuture]]:
+        return self.client.queued_subscriptions
+
+    @property
+    def subscription_id_counter(self) -> int:
+        return self.client.subscription_id_counter
+
+    @property
+    def env(self) -> Environment:
+        return self.client.env
+
+    @property
+    def api_url(self) -> str:
+        return self.client.api_url
+
+    @property
+    def account(self) -> Optional[ParadexAccount]:
+        return self.client.account
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self.client.logger
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self.client.run())
+
+    def send_auth_id(self) -> None:
+        """
+        Sends an authentication message to the Paradex WebSocket.
+        """
+        self._call(self.client.send_auth_id)
+
+    def reconnect(self) -> None:
+        """Drops the current connection, the client reconnects and replays its subscriptions."""
+        ws = self.client.ws
+        if ws is not None and self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(ws.close(), self.loop)
+
+    def _handle_reconnect(self, _client: AsyncParadexWebsocketClient) -> None:
         if self.on_reconnect:
-            self.on_reconnect(new_client)  # Notify Paradex about the new instance
+            self.on_reconnect(self)
+
+    def _call(self, fn: Callable, *args, **kwargs) -> Any:
+        if self.client._closed or (self.ident is not None and not self.is_alive()):
+            # Nothing would ever send the request or resolve its future
+            raise RuntimeError(f"{self.classname}: Websocket client is closed")
+        # Client state is owned by the event loop thread, calls from other threads are marshalled onto it
+        if threading.current_thread() is self or not self.loop.is_running():
+            return fn(*args, **kwargs)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def call():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+        self.loop.call_soon_threadsafe(call)
+        return future.result()
+
+    def close(self) -> None:
+        """Closes the websocket connection and stops reconnecting."""
+        if not self.loop.is_running():
+            return
+        # The loop stops as soon as run() returns, so wait for the thread rather than the close coroutine
+        asyncio.run_coroutine_threadsafe(self.client.close(), self.loop)
+        if threading.current_thread() is not self:
+            self.join()
+
+    def subscribe(
+        self,
+        channel: ParadexWebsocketChannel,
+        callback: Callable[[Any], None],
+        subscription_id: Optional[int] = None,
+        params: Optional[dict] = None,
+    ) -> SubscriptionFuture:
+        """Subscribe to a channel.
+        Subscriptions made before the websocket is connected are sent once it is.
+
+        Returns:
+            SubscriptionFuture resolved with the subscription id once Paradex acknowledges the subscription
+
+        Examples:
+            >>> subscription_id = ws_client.subscribe(ParadexWebsocketChannel.POSITIONS, print).result(timeout=5)
+        """
+        return self._call(
+            self.client.subscribe, channel=channel, callback=callback, subscription_id=subscription_id, params=params
+        )
+
+    def subscribe_many(
+        self, specs: List[Tuple[ParadexWebsocketChannel, Callable[[Any], None], Optional[dict]]]
+    ) -> List[SubscriptionFuture]:
+        """Subscribe to several channels at once.
+        Subscribe requests are sent to Paradex as a single JSON-RPC batch frame,
+        subscriptions made before the websocket is connected are sent one by one once it is.
+
+        Args:
+            specs: List of (channel, callback, params) tuples
+
+        Returns:
+            List of SubscriptionFuture resolved with subscription ids, in the same order as specs
+        """
+        return self._call(self.client.subscribe_many, specs=specs)
+
+    def unsubscribe(
+        self,
+        channel: ParadexWebsocketChannel,
+        subscription_id: Union[int, SubscriptionFuture],
+        params: Optional[dict] = None,
+    ) -> bool:
+        return self._call(self.client.unsubscribe, channel=channel, subscription_id=subscription_id, params=params)
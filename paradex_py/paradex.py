@@ -1,10 +1,10 @@
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from paradex_py.account.account import ParadexAccount
 from paradex_py.api.api_client import ParadexApiClient
 from paradex_py.api.models import ParadexWebsocketChannel
-from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.api.ws_client import ParadexWebsocketClient, SubscriptionFuture
 from paradex_py.environment import Environment
 from paradex_py.utils import raise_value_error
 
@@ -88,14 +88,30 @@ class Paradex:
 
     def ws_subscribe(
         self, channel: ParadexWebsocketChannel, callback: Callable[[Any], None], params: Optional[dict] = None
-    ) -> int:
+    ) -> SubscriptionFuture:
+        """Subscribe to a websocket channel.
+
+        Returns:
+            SubscriptionFuture resolved with the subscription id once Paradex acknowledges the subscription
+        """
         if self.ws_client is None:
             raise RuntimeError("Cannot call subscribe since skip_ws was used")
         else:
             return self.ws_client.subscribe(channel=channel, callback=callback, params=params)
 
+    def ws_subscribe_many(
+        self, specs: List[Tuple[ParadexWebsocketChannel, Callable[[Any], None], Optional[dict]]]
+    ) -> List[SubscriptionFuture]:
+        if self.ws_client is None:
+            raise RuntimeError("Cannot call subscribe since skip_ws was used")
+        else:
+            return self.ws_client.subscribe_many(specs=specs)
+
     def ws_unsubscribe(
-        self, channel: ParadexWebsocketChannel, subscription_id: int, params: Optional[dict] = None
+        self,
+        channel: ParadexWebsocketChannel,
+        subscription_id: Union[int, SubscriptionFuture],
+        params: Optional[dict] = None,
     ) -> bool:
         if self.ws_client is None:
             raise RuntimeError("Cannot call unsubscribe since skip_ws was used")
@@ -0,0 +1,519 @@
+import asyncio
+import contextlib
+import threading
+import time
+
+import orjson
+import pytest
+from websockets.exceptions import ConnectionClosedOK
+
+from paradex_py.api import ws_client
+from paradex_py.api.models import ParadexWebsocketChannel, PositionMsg, PositionSide
+from paradex_py.api.ws_client import (
+    ActiveSubscription,
+    AsyncParadexWebsocketClient,
+    ParadexWebsocketClient,
+    SubscriptionFuture,
+)
+from paradex_py.common.order import OrderSide
+from paradex_py.environment import TESTNET
+
+POSITION_DATA = {
+    "average_entry_price": "29863.2",
+    "average_entry_price_usd": "29863.2",
+    "average_exit_price": "",
+    "cached_funding_index": "1234.3",
+    "cost": "-10.005",
+    "cost_usd": "-10.005",
+    "created_at": 1681493939981,
+    "id": "1234234",
+    "last_fill_id": "1234234",
+    "last_updated_at": 1681493939981,
+    "leverage": "",
+    "liquidation_price": "",
+    "market": "BTC-USD-PERP",
+    "realized_positional_funding_pnl": "12.234",
+    "realized_positional_pnl": "-123.23",
+    "seq_no": 20784,
+    "side": "SHORT",
+    "size": "-0.345",
+    "status": "OPEN",
+    "unrealized_funding_pnl": "12.234",
+    "unrealized_pnl": "-123.23",
+}
+
+FILL_DATA = {
+    "client_id": "x1234",
+    "created_at": 1681375176910,
+    "fee": "7.56",
+    "fee_currency": "USDC",
+    "fill_type": "FILL",
+    "id": "8615262148007718462",
+    "liquidity": "TAKER",
+    "market": "BTC-USD-PERP",
+    "order_id": "1681462103821101699438490000",
+    "price": "30000.12",
+    "realized_funding": "7.56",
+    "realized_pnl": "7.56",
+    "remaining_size": "0.5",
+    "side": "BUY",
+    "size": "0.5",
+}
+
+
+def make_client(ws_ready: bool = True) -> AsyncParadexWebsocketClient:
+    client = AsyncParadexWebsocketClient(env=TESTNET)
+    client.ws_ready = ws_ready
+    client._out_q = asyncio.Queue()
+    return client
+
+
+def sent_frames(client: AsyncParadexWebsocketClient) -> list:
+    frames = []
+    while not client._out_q.empty():
+        frames.append(orjson.loads(client._out_q.get_nowait()))
+    return frames
+
+
+def queued_callbacks(client: AsyncParadexWebsocketClient) -> list:
+    data = []
+    for callback_queue in client._callback_queues:
+        while not callback_queue.empty():
+            data.append(callback_queue.get_nowait()[1])
+    return data
+
+
+def notification(channel: str, data: dict) -> bytes:
+    return orjson.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+def test_subscribe_request_templates():
+    client = make_client()
+    assert orjson.loads(client._subscribe_request("positions", 7)) == {
+        "id": 7,
+        "jsonrpc": "2.0",
+        "method": "subscribe",
+        "params": {"channel": "positions"},
+    }
+    assert orjson.loads(client._unsubscribe_request("bbo.ETH-USD-PERP", 8)) == {
+        "id": 8,
+        "jsonrpc": "2.0",
+        "method": "unsubscribe",
+        "params": {"channel": "bbo.ETH-USD-PERP"},
+    }
+
+
+@pytest.mark.parametrize("channel", sorted(ws_client._SUBSCRIBE_TEMPLATES))
+def test_templates_match_encoded_requests(channel):
+    client = make_client()
+    for method, templates in (
+        ("subscribe", ws_client._SUBSCRIBE_TEMPLATES),
+        ("unsubscribe", ws_client._UNSUBSCRIBE_TEMPLATES),
+    ):
+        expected = {"id": 42, "jsonrpc": "2.0", "method": method, "params": {"channel": channel}}
+        assert orjson.loads(templates[channel] % 42) == expected
+        # Channels with params are encoded without a template
+        assert orjson.loads(client._channel_request(method, templates, channel + ".X", 42))["params"] == {
+            "channel": channel + ".X"
+        }
+
+
+def test_subscribe_many_sends_batch_frame():
+    client = make_client()
+    futures = client.subscribe_many(
+        [
+            (ParadexWebsocketChannel.POSITIONS, print, None),
+            (ParadexWebsocketChannel.BBO, print, {"market": "ETH-USD-PERP"}),
+        ]
+    )
+
+    (frame,) = sent_frames(client)
+    assert [request["method"] for request in frame] == ["subscribe", "subscribe"]
+    assert [request["params"]["channel"] for request in frame] == ["positions", "bbo.ETH-USD-PERP"]
+    assert [future.subscription_id for future in futures] == [1, 2]
+
+
+def test_queued_subscriptions_sent_on_open():
+    client = make_client(ws_ready=False)
+    client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    client.subscribe(ParadexWebsocketChannel.TRANSFERS, print)
+    assert sent_frames(client) == []
+
+    client.on_open()
+
+    frames = sent_frames(client)
+    assert [request["params"]["channel"] for request in frames] == ["positions", "transfers"]
+    assert set(client.active_subscriptions) == {"positions", "transfers"}
+
+
+def test_subscriptions_replayed_on_open():
+    client = make_client()
+    client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    client.subscribe(ParadexWebsocketChannel.BBO, print, params={"market": "ETH-USD-PERP"})
+    sent_frames(client)
+
+    client.on_open()
+
+    frames = sent_frames(client)
+    assert [request["method"] for request in frames] == ["subscribe", "subscribe"]
+    assert [request["params"]["channel"] for request in frames] == ["positions", "bbo.ETH-USD-PERP"]
+
+
+def test_duplicate_subscription_rejected_before_open():
+    client = make_client(ws_ready=False)
+    client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    with pytest.raises(NotImplementedError):
+        client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    assert len(client.queued_subscriptions) == 1
+
+
+def test_dispatch_and_unsubscribe():
+    client = make_client()
+    params = {"market": "ETH-USD-PERP"}
+    first = client.subscribe(ParadexWebsocketChannel.TRADES, print, params=params)
+    second = client.subscribe(ParadexWebsocketChannel.TRADES, print, params=params)
+    sent_frames(client)
+
+    client.read_messages(notification("trades.ETH-USD-PERP", {"price": "1"}))
+    assert len(queued_callbacks(client)) == 2
+
+    assert client.unsubscribe(ParadexWebsocketChannel.TRADES, first, params=params)
+    assert sent_frames(client) == []
+    client.read_messages(notification("trades.ETH-USD-PERP", {"price": "2"}))
+    assert len(queued_callbacks(client)) == 1
+
+    assert client.unsubscribe(ParadexWebsocketChannel.TRADES, second.subscription_id, params=params)
+    (frame,) = sent_frames(client)
+    assert frame["method"] == "unsubscribe"
+    assert client.active_subscriptions == {}
+    assert client._dispatch == {}
+
+
+def test_dispatch_index_by_prefix_and_params():
+    client = make_client()
+    client.subscribe(ParadexWebsocketChannel.ORDER_BOOK_DELTAS, print, params={"market": "ETH-USD-PERP"})
+    client.subscribe(ParadexWebsocketChannel.ORDER_BOOK_DELTAS, print, params={"market": "BTC-USD-PERP"})
+    client.subscribe(ParadexWebsocketChannel.ACCOUNT, print)
+
+    assert set(client._dispatch) == {"order_book", "account"}
+    assert set(client._dispatch["order_book"]) == {"ETH-USD-PERP.deltas", "BTC-USD-PERP.deltas"}
+    assert set(client._dispatch["account"]) == {""}
+
+    client.read_messages(notification("order_book.BTC-USD-PERP.deltas", {"seq_no": 1}))
+    client.read_messages(notification("order_book.SOL-USD-PERP.deltas", {"seq_no": 2}))
+    assert [message["data"]["seq_no"] for message in queued_callbacks(client)] == [1]
+
+    client.unsubscribe(ParadexWebsocketChannel.ORDER_BOOK_DELTAS, 1, params={"market": "ETH-USD-PERP"})
+    client.unsubscribe(ParadexWebsocketChannel.ORDER_BOOK_DELTAS, 2, params={"market": "BTC-USD-PERP"})
+    assert set(client._dispatch) == {"account"}
+    assert set(client.active_subscriptions) == {"account"}
+
+
+def test_typed_messages_decoded_into_structs():
+    client = make_client()
+    client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    client.subscribe(ParadexWebsocketChannel.FILLS, print, params={"market": "BTC-USD-PERP"})
+
+    client.read_messages(notification("positions", POSITION_DATA))
+    client.read_messages(notification("fills.BTC-USD-PERP", FILL_DATA))
+    client.read_messages(notification("positions", {**POSITION_DATA, "side": "UP"}))
+
+    # Positions and fills subscriptions run on different workers
+    position, unknown_side, fill = queued_callbacks(client)
+    assert isinstance(position, PositionMsg)
+    assert position.data.side == PositionSide.SHORT
+    assert position.data.size == "-0.345"
+    assert fill.data.side == OrderSide.Buy
+    assert fill.data.price == "30000.12"
+    # Messages that don't match the schema are not lost
+    assert unknown_side["data"]["side"] == "UP"
+
+
+def test_subscribe_ack_resolves_future():
+    client = make_client()
+    future = client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    (request,) = sent_frames(client)
+    assert not future.done()
+
+    client.read_messages(orjson.dumps({"jsonrpc": "2.0", "result": {"channel": "positions"}, "id": request["id"]}))
+    assert future.result(timeout=0) == future.subscription_id
+
+
+def test_subscribe_error_rejects_future():
+    client = make_client()
+    futures = client.subscribe_many(
+        [
+            (ParadexWebsocketChannel.POSITIONS, print, None),
+            (ParadexWebsocketChannel.TRANSFERS, print, None),
+        ]
+    )
+    (frame,) = sent_frames(client)
+
+    client.read_messages(
+        orjson.dumps(
+            [
+                {"jsonrpc": "2.0", "result": {"channel": "positions"}, "id": frame[0]["id"]},
+                {"jsonrpc": "2.0", "error": {"code": -32600, "message": "invalid"}, "id": frame[1]["id"]},
+            ]
+        )
+    )
+    assert futures[0].result(timeout=0) == futures[0].subscription_id
+    with pytest.raises(RuntimeError):
+        futures[1].result(timeout=0)
+    assert set(client.active_subscriptions) == {"positions"}
+
+
+def test_ack_for_cancelled_future_ignored():
+    client = make_client()
+    future = client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    (request,) = sent_frames(client)
+    future.cancel()
+
+    client.read_messages(orjson.dumps({"jsonrpc": "2.0", "result": {"channel": "positions"}, "id": request["id"]}))
+    assert future.cancelled()
+
+
+def test_pending_ack_survives_reconnect():
+    client = make_client()
+    future = client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    sent_frames(client)
+
+    client._defer_pending_acks()
+    assert not future.done()
+
+    client.on_open()
+    (request,) = sent_frames(client)
+    client.read_messages(orjson.dumps({"jsonrpc": "2.0", "result": {"channel": "positions"}, "id": request["id"]}))
+    assert future.result(timeout=0) == future.subscription_id
+
+
+def test_pending_ack_fails_on_close():
+    client = make_client()
+    future = client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+
+    client._defer_pending_acks()
+    client._fail_replay_acks()
+    with pytest.raises(ConnectionError):
+        future.result(timeout=0)
+
+
+class FakeConnection:
+    def __init__(self, messages=(), stay_open=False, connect_delay=0.0):
+        self.messages = list(messages)
+        self.connect_delay = connect_delay
+        # Keeps the connection open once all messages are read, until close() is called
+        self.stay_open = stay_open
+        self.closed = False
+        self.sent = []
+
+    async def recv(self, decode=None):
+        while not self.messages and self.stay_open and not self.closed:
+            await asyncio.sleep(0.01)
+        if not self.messages or self.closed:
+            raise ConnectionClosedOK(None, None)
+        return self.messages.pop(0)
+
+    async def send(self, frame):
+        self.sent.append(frame)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    connections = []
+
+    @contextlib.asynccontextmanager
+    async def fake_connect(*args, **kwargs):
+        connection = connections.pop(0)
+        await asyncio.sleep(connection.connect_delay)
+        yield connection
+
+    monkeypatch.setattr(ws_client, "connect", fake_connect)
+    return connections
+
+
+async def wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_bad_frames_do_not_stop_reader(connections):
+    client = make_client()
+    client.subscribe(ParadexWebsocketChannel.TRADES, print, params={"market": "ETH-USD-PERP"})
+    client.ws_ready = False
+    # Duplicates slipped past validation, sending the queued subscriptions fails on open
+    futures = [SubscriptionFuture(2), SubscriptionFuture(3)]
+    for future in futures:
+        subscription = ActiveSubscription(print, future.subscription_id)
+        client.queued_subscriptions.append((ParadexWebsocketChannel.POSITIONS, {}, subscription, future))
+    connection = FakeConnection([b'{"params":', notification("trades.ETH-USD-PERP", {"price": "1"})])
+    connections.append(connection)
+
+    asyncio.run(client._connect_and_read())
+
+    assert connection.messages == []
+    assert len(queued_callbacks(client)) == 1
+    assert all(isinstance(future.exception(timeout=0), NotImplementedError) for future in futures)
+
+
+def test_run_stops_callback_workers(connections):
+    client = AsyncParadexWebsocketClient(env=TESTNET)
+    received = []
+    client.subscribe(ParadexWebsocketChannel.TRADES, received.append, params={"market": "ETH-USD-PERP"})
+    connections.append(FakeConnection([notification("trades.ETH-USD-PERP", {"price": "1"})], stay_open=True))
+    threads = threading.active_count()
+
+    async def main():
+        task = asyncio.create_task(client.run())
+        await wait_for(lambda: received)
+        await client.close()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(main())
+    # A closed client can be run again without leaking threads
+    asyncio.run(client.run())
+
+    assert received == [{"channel": "trades.ETH-USD-PERP", "data": {"price": "1"}}]
+    assert threading.active_count() == threads
+
+
+def test_slow_callbacks_pause_reading(connections, monkeypatch):
+    monkeypatch.setattr(ws_client, "_CALLBACK_QUEUE_SIZE", 1)
+    client = AsyncParadexWebsocketClient(env=TESTNET)
+    release = threading.Event()
+    received = []
+
+    def slow_callback(message):
+        release.wait()
+        received.append(message["data"]["seq"])
+
+    client.subscribe(ParadexWebsocketChannel.TRADES, slow_callback, params={"market": "ETH-USD-PERP"})
+    connection = FakeConnection(
+        [notification("trades.ETH-USD-PERP", {"seq": seq}) for seq in range(5)],
+        stay_open=True,
+    )
+    connections.append(connection)
+
+    async def main():
+        task = asyncio.create_task(client.run())
+        try:
+            # The event loop stays responsive while the reader waits for the worker
+            await asyncio.sleep(0.1)
+            assert connection.messages
+        finally:
+            release.set()
+        await wait_for(lambda: len(received) == 5)
+        await client.close()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(main())
+
+    # No message is dropped and order is kept
+    assert received == [0, 1, 2, 3, 4]
+
+
+def test_close_during_connect(connections):
+    client = AsyncParadexWebsocketClient(env=TESTNET)
+    connection = FakeConnection(stay_open=True, connect_delay=0.2)
+    connections.append(connection)
+
+    async def main():
+        task = asyncio.create_task(client.run())
+        await asyncio.sleep(0.05)
+        await client.close()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(main())
+
+    assert connection.closed
+    assert not client.ws_ready
+
+
+class FailingConnection(FakeConnection):
+    async def send(self, frame):
+        if not self.sent:
+            self.sent.append(None)
+            raise ValueError("write failed")
+        await super().send(frame)
+
+
+def test_writer_survives_write_errors(connections):
+    client = AsyncParadexWebsocketClient(env=TESTNET)
+    connection = FailingConnection(stay_open=True)
+    connections.append(connection)
+
+    async def main():
+        task = asyncio.create_task(client.run())
+        await wait_for(lambda: client.ws_ready)
+        client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+        await wait_for(lambda: connection.sent)
+        client.subscribe(ParadexWebsocketChannel.TRANSFERS, print)
+        await wait_for(lambda: len(connection.sent) == 2)
+        await client.close()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(main())
+
+    assert orjson.loads(connection.sent[1])["params"]["channel"] == "transfers"
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_sync_client_reconnects_and_replays(connections, monkeypatch):
+    monkeypatch.setattr(ws_client, "_RECONNECT_DELAY_SECONDS", 0)
+    first, second = FakeConnection(stay_open=True), FakeConnection(stay_open=True)
+    connections.extend([first, second])
+    client = ParadexWebsocketClient(env=TESTNET)
+    assert client.api_url == "wss://ws.api.testnet.paradex.trade/v1"
+
+    client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+    assert len(client.queued_subscriptions) == 1
+    client.start()
+    wait_until(lambda: first.sent)
+
+    client.reconnect()
+    wait_until(lambda: second.sent)
+    client.close()
+
+    assert not client.is_alive()
+    assert first.closed
+    assert orjson.loads(second.sent[0])["params"]["channel"] == "positions"
+
+
+def test_sync_client_rejects_calls_after_close(connections):
+    connections.append(FakeConnection(stay_open=True))
+    client = ParadexWebsocketClient(env=TESTNET)
+    client.start()
+    wait_until(lambda: client.ws_ready)
+    client.close()
+
+    with pytest.raises(RuntimeError):
+        client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+
+
+class AckingConnection(FakeConnection):
+    async def send(self, frame):
+        await super().send(frame)
+        request = orjson.loads(frame)
+        self.messages.append(orjson.dumps({"jsonrpc": "2.0", "result": {}, "id": request["id"]}))
+
+
+def test_sync_client_subscribe_future_resolved_on_ack(connections):
+    connections.append(AckingConnection(stay_open=True))
+    client = ParadexWebsocketClient(env=TESTNET)
+    client.start()
+    try:
+        future = client.subscribe(ParadexWebsocketChannel.POSITIONS, print)
+        assert future.result(timeout=2) == future.subscription_id
+        assert client.unsubscribe(ParadexWebsocketChannel.POSITIONS, future)
+    finally:
+        client.close()
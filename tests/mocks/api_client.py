@@ -1,4 +1,4 @@
-from paradex_py.api.models import SystemConfig, SystemConfigSchema
+from paradex_py.api.models import SystemConfig
 
 MOCK_CONFIG = {
     "starknet_gateway_url": "https://potc-testnet-sepolia.starknet.io",
@@ -30,4 +30,4 @@ MOCK_CONFIG = {
 
 class MockApiClient:
     def fetch_system_config(self) -> SystemConfig:
-        return SystemConfigSchema().load(MOCK_CONFIG)
+        return SystemConfig.from_dict(MOCK_CONFIG)